@@ -0,0 +1,9 @@
+"""Tests for wiki_tool_python."""
+import os
+import sys
+
+# Modules are imported the same way as in `wikitool.py`
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                    'wiki_tool_python')
+)
@@ -0,0 +1,64 @@
+"""Tests for asynchronous MediaWiki API class."""
+import json
+from typing import Any, Dict, List
+import unittest
+
+import mediawiki
+
+
+def make_response(data: Dict[str, Any]) -> Any:
+    """Return fake `httpx` response with JSON `data`."""
+    return mediawiki.httpx.Response(200, content=json.dumps(data).encode())
+
+
+@unittest.skipIf(mediawiki.httpx is None, 'httpx is not installed')
+class AsyncMediaWikiAPI1_31Test(unittest.IsolatedAsyncioTestCase):
+    """Tests for `AsyncMediaWikiAPI1_31` with mocked `httpx` transport."""
+
+    async def asyncSetUp(self):
+        """Create API object which sends requests to `handle_request`."""
+        self.requests: List[Any] = []
+        self.api = mediawiki.AsyncMediaWikiAPI1_31('http://wiki.test')
+        await self.api.session.aclose()
+        self.api.session = mediawiki.httpx.AsyncClient(
+            transport=mediawiki.httpx.MockTransport(self.handle_request)
+        )
+
+    async def asyncTearDown(self):
+        """Close API object."""
+        await self.api.close()
+
+    def handle_request(self, request: Any) -> Any:
+        """Respond with two pages of `allpages` list or with page text."""
+        self.requests.append(request)
+        params = request.url.params
+        if request.url.path == '/index.php':
+            return mediawiki.httpx.Response(
+                200, content=f"text of {params['title']} ü".encode()
+            )
+        if 'apcontinue' not in params:
+            return make_response({
+                'continue': {'apcontinue': 'B', 'continue': '-||'},
+                'query': {'allpages': [{'title': 'A'}]},
+            })
+        return make_response({
+            'query': {'allpages': [{'title': params['apcontinue']}]},
+        })
+
+    async def test_paginate(self):
+        """All pages of list are requested, following continuation."""
+        titles = [
+            title async for title in self.api.get_page_list(0, 1)
+        ]
+
+        self.assertEqual(titles, ['A', 'B'])
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].url.params['apcontinue'], 'B')
+
+    async def test_fetch_pages_bulk(self):
+        """Page texts are returned in the same order as titles."""
+        titles = [f'Page{i}' for i in range(5)]
+
+        texts = await self.api.fetch_pages_bulk(titles, concurrency=2)
+
+        self.assertEqual(texts, [f'text of {title} ü' for title in titles])
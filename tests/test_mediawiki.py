@@ -0,0 +1,194 @@
+"""Tests for MediaWiki API module."""
+import io
+import json
+from typing import Any, Dict
+import unittest
+from unittest import mock
+
+import requests
+from urllib3.response import HTTPResponse
+
+import mediawiki
+
+
+def make_response(data: Dict[str, Any]) -> mock.Mock:
+    """Return fake HTTP response with JSON `data`."""
+    return mock.Mock(status_code=200, content=json.dumps(data).encode())
+
+
+def make_stream_response(data: Dict[str, Any]) -> requests.Response:
+    """Return fake streamed HTTP response with JSON `data`."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(
+        body=io.BytesIO(json.dumps(data).encode()), preload_content=False
+    )
+    return response
+
+
+class TokenCacheTest(unittest.TestCase):
+    """Tests for `TokenCache`."""
+
+    def test_least_recently_used_token_is_evicted(self):
+        """Least recently used token is evicted when cache is full."""
+        tokens = mediawiki.TokenCache(max_size=2)
+        tokens.update({'A': '1', 'B': '2'})
+        self.assertEqual(tokens['A'], '1')
+        tokens.update({'C': '3'})
+
+        self.assertEqual(len(tokens), 2)
+        self.assertIn('A', tokens)
+        self.assertNotIn('B', tokens)
+        self.assertIn('C', tokens)
+
+    def test_discard(self):
+        """Discarded token is removed, missing token is ignored."""
+        tokens = mediawiki.TokenCache()
+        tokens.update({'A': '1'})
+        tokens.discard('A')
+        tokens.discard('B')
+
+        self.assertEqual(len(tokens), 0)
+
+
+class IterateJsonValuesTest(unittest.TestCase):
+    """Tests for `iterate_json_values`."""
+
+    def test_values_with_prefixes(self):
+        """Only values with given prefixes are returned, in order."""
+        document = {
+            'continue': {'drcontinue': '5', 'continue': '-||'},
+            'query': {'deletedrevs': [
+                {'title': 'A', 'revisions': [{'revid': 1, '*': 'text'}]},
+                {'title': 'B', 'revisions': []},
+            ]},
+            'warnings': 'ignored',
+        }
+        file = io.BytesIO(json.dumps(document).encode())
+
+        values = list(mediawiki.iterate_json_values(
+            file, ('continue', 'query.deletedrevs.item')
+        ))
+
+        self.assertEqual(values, [
+            ('continue', document['continue']),
+            ('query.deletedrevs.item', document['query']['deletedrevs'][0]),
+            ('query.deletedrevs.item', document['query']['deletedrevs'][1]),
+        ])
+
+    def test_scalar_value(self):
+        """Scalar values are returned as is."""
+        file = io.BytesIO(b'{"error": "message", "other": 1.5}')
+
+        values = list(mediawiki.iterate_json_values(file, ('error',)))
+
+        self.assertEqual(values, [('error', 'message')])
+
+
+class MediaWikiAPI1_19TokenTest(unittest.TestCase):
+    """Tests for page tokens in `MediaWikiAPI1_19`."""
+
+    def setUp(self):
+        """Create API object with fake `session.post`."""
+        self.api = mediawiki.MediaWikiAPI1_19('http://wiki.test')
+        self.post = mock.patch.object(self.api.session, 'post').start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(self.api.close)
+
+    def set_responses(self, token_type: str) -> None:
+        """Respond with page token, then with successful action."""
+        self.post.side_effect = [
+            make_response({'query': {'pages': {'1': {
+                'title': 'Page', f'{token_type}token': 'abc+\\',
+            }}}}),
+            make_response({token_type: {'result': 'Success'}}),
+        ]
+
+    def test_delete_token_is_string(self):
+        """Delete token is passed to API as string."""
+        self.set_responses('delete')
+
+        self.api.delete_page('Page')
+
+        token = self.post.call_args.kwargs['data']['token']
+        self.assertIsInstance(token, str)
+        self.assertEqual(token, 'abc+\\')
+
+    def test_edit_token_is_string(self):
+        """Edit token is passed to API as string."""
+        self.set_responses('edit')
+
+        self.api.edit_page('Page', 'text')
+
+        token = self.post.call_args.kwargs['data']['token']
+        self.assertIsInstance(token, str)
+        self.assertEqual(token, 'abc+\\')
+
+    def test_prefetch_tokens_skips_invalid_titles(self):
+        """Invalid title does not prevent caching tokens of other titles."""
+        self.post.side_effect = [
+            make_response({'query': {
+                'normalized': [{'from': 'page_a', 'to': 'Page a'}],
+                'pages': {
+                    '1': {'title': 'Page a', 'deletetoken': 'abc+\\'},
+                    '-1': {'title': 'Bad|', 'invalid': ''},
+                },
+            }}),
+            make_response({'query': {'pages': {
+                '-1': {'title': 'Bad|', 'invalid': ''},
+            }}}),
+        ]
+
+        self.api.prefetch_tokens('delete', ['page_a', 'Bad|'])
+
+        self.assertIn('page_a', self.api.delete_tokens)
+        self.assertNotIn('Bad|', self.api.delete_tokens)
+        with self.assertRaises(mediawiki.MediaWikiAPIError):
+            self.api.delete_page('Bad|')
+
+
+class MediaWikiAPI1_31DeletedRevisionsTest(unittest.TestCase):
+    """Tests for deleted revisions in `MediaWikiAPI1_31`."""
+
+    def setUp(self):
+        """Create API object with fake `send_get`."""
+        self.api = mediawiki.MediaWikiAPI1_31('http://wiki.test')
+        self.send_get = mock.patch.object(self.api, 'send_get').start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(self.api.close)
+
+    def test_revision_text_key(self):
+        """Revision text is returned under `*` key, following continuation."""
+        self.send_get.side_effect = [
+            make_stream_response({
+                'batchcomplete': '',
+                'continue': {'drcontinue': '0|B|2', 'continue': '-||'},
+                'query': {'deletedrevs': [{
+                    'title': 'A', 'ns': 0,
+                    'revisions': [{
+                        'revid': 1, 'user': 'U', 'comment': '', '*': 'a',
+                    }],
+                }]},
+            }),
+            make_stream_response({
+                'batchcomplete': '',
+                'query': {'deletedrevs': [{
+                    'title': 'B', 'ns': 0,
+                    'revisions': [{
+                        'revid': 2, 'user': 'U', 'comment': '', '*': 'b',
+                    }],
+                }]},
+            }),
+        ]
+
+        revisions = list(self.api.get_deletedrevs_list(0, 1))
+
+        self.assertEqual(
+            [(revision['title'], revision['*']) for revision in revisions],
+            [('A', 'a'), ('B', 'b')]
+        )
+        first_url, second_url = (
+            call.args[0] for call in self.send_get.call_args_list
+        )
+        self.assertNotIn('formatversion', first_url)
+        self.assertIn('drcontinue=0%7CB%7C2', second_url)
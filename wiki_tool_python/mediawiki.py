@@ -1,14 +1,68 @@
 """MediaWiki API interaction functions."""
 from abc import ABC, abstractmethod
+import asyncio
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
 import datetime
-from typing import List, Iterable, Iterator, Dict, Any, Optional, BinaryIO
-
+import time
+from typing import (
+    List, Iterable, Iterator, AsyncIterator, Dict, Any, Optional, BinaryIO,
+    Container, Tuple, NoReturn, Deque
+)
+from urllib.parse import urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore
 import click
+try:
+    import httpx
+    import h2  # noqa: F401 (required by httpx for HTTP/2)
+except ImportError:
+    httpx = None  # type: ignore
+try:
+    import ijson.backends.yajl2_c as ijson  # type: ignore
+except ImportError:
+    import ijson  # type: ignore
+from ijson.common import ObjectBuilder  # type: ignore
+try:
+    import orjson
+except ImportError:
+    import json as orjson  # type: ignore
 import requests
+from requests.adapters import HTTPAdapter
 import requests_toolbelt
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 NAMESPACE_IMAGES = 6
 
+USER_AGENT = 'wiki_tool_python/0.1.0'
+
+# Parameters of requests to MediaWiki 1.31 API: compact JSON format,
+# with non-ASCII characters not escaped
+BASE_PARAMS: Dict[str, str] = {
+    'format': 'json',
+    'formatversion': '2',
+    'utf8': '1',
+}
+
+# Maximum number of titles per API request
+TITLES_LIMIT = 50
+
+# Number of background threads for API requests
+WORKERS_NUM = 4
+
+# Number of pages requested ahead by `get_pages_bulk`
+PAGES_PREFETCH_NUM = 4
+
+# Maximum number of page tokens cached by MediaWiki 1.19 API
+TOKEN_CACHE_SIZE = 1024
+
+# Time in seconds after which CSRF token is requested again
+CSRF_TOKEN_TTL = 3600
+
 
 class MediaWikiAPIError(click.ClickException):
     """MediaWiki API error."""
@@ -22,9 +76,423 @@ class PageProtected(MediaWikiAPIError):
     """Page can not be edited because it is protected."""
 
 
+def raise_api_error(error: Dict[str, Any]) -> NoReturn:
+    """Raise exception for MediaWiki API `error`."""
+    if error['code'] == 'cantdelete':
+        raise CanNotDelete(error['info'])
+    raise MediaWikiAPIError(error['info'])
+
+
+def create_session() -> requests.Session:
+    """
+    Create HTTP session for MediaWiki API.
+
+    Connections are kept alive and reused, failed GET requests are retried.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            # Last response is returned, so status code is checked as before
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        # Brotli is only accepted if urllib3 can decode it
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def prepare_get(
+    session: requests.Session, url: str
+) -> Tuple[requests.PreparedRequest, Dict[str, Any]]:
+    """
+    Prepare GET request template and send settings for `session` and `url`.
+
+    Settings (proxies and certificates from environment) are resolved once, so
+    they are not looked up again for every request.
+    """
+    template = session.prepare_request(requests.Request('GET', url))
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    del settings['stream']
+    return template, settings
+
+
+def parse_json(content: bytes) -> Any:
+    """Parse JSON document from raw response bytes."""
+    return orjson.loads(content)
+
+
+def iterate_json_values(
+    file: BinaryIO, prefixes: Container[str]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate over values with given `prefixes` in JSON document from `file`.
+
+    Yield pairs of prefix and value. Document is parsed incrementally, so
+    only one value is kept in memory at a time.
+    """
+    builder: Optional[ObjectBuilder] = None
+    builder_prefix: str = ''
+    for prefix, event, value in ijson.parse(file, use_float=True):
+        if builder is None:
+            if prefix not in prefixes or event in (
+                'map_key', 'end_map', 'end_array'
+            ):
+                continue
+            if event not in ('start_map', 'start_array'):
+                yield prefix, value
+                continue
+            builder = ObjectBuilder()
+            builder_prefix = prefix
+        builder.event(event, value)
+        if prefix == builder_prefix and event in ('end_map', 'end_array'):
+            yield prefix, builder.value
+            builder = None
+
+
+def get_continue(data: Dict[str, Any], path: str) -> Optional[Dict[str, Any]]:
+    """Return continuation parameters at dotted `path` in API response."""
+    value: Any = data
+    for key in path.split('.'):
+        if key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def close_response(future: 'Future[requests.Response]') -> None:
+    """Close response of finished `future`, if request succeeded."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def get_namespace_list_params() -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to get namespaces."""
+    return {
+        'action': 'query',
+        'meta': 'siteinfo',
+        'siprop': 'namespaces',
+        **BASE_PARAMS,
+    }
+
+
+def get_namespace_ids(data: Dict[str, Any]) -> List[int]:
+    """Return IDs of non-virtual namespaces from API response `data`."""
+    return [
+        namespace_id
+        for namespace_id in map(int, data['query']['namespaces'].keys())
+        if namespace_id >= 0
+    ]
+
+
+def get_image_list_params(limit: int) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to list all images."""
+    return {
+        'action': 'query',
+        'list': 'allimages',
+        'aidir': 'ascending',
+        'ailimit': limit,
+        **BASE_PARAMS,
+    }
+
+
+def get_image_data(image_data: Dict[str, Any]) -> Dict[str, str]:
+    """Return `title` and `url` of image from API list item."""
+    return {
+        'title': image_data['title'],
+        'url': image_data['url'],
+    }
+
+
+def get_page_list_params(
+    namespace: int, limit: int, first_page: Optional[str],
+    redirect_filter_mode: str
+) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to list pages in `namespace`."""
+    params: Dict[str, Any] = {
+        'action': 'query',
+        'list': 'allpages',
+        'apnamespace': namespace,
+        'apdir': 'ascending',
+        'apfilterredir': redirect_filter_mode,
+        'aplimit': limit,
+        **BASE_PARAMS,
+    }
+    if first_page is not None:
+        params['apfrom'] = first_page
+
+    return params
+
+
+def get_page_params(title: str) -> Dict[str, Any]:
+    """Return index.php parameters to get raw text of page with `title`."""
+    return {
+        'action': 'raw',
+        'title': title,
+    }
+
+
+def decode_page(content: bytes) -> str:
+    """Decode raw page text."""
+    # MediaWiki always responds in UTF-8, so encoding is not detected
+    return content.decode('utf-8', errors='replace')
+
+
+def get_search_params(
+    search_request: str, namespace: int, limit: int
+) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to search pages."""
+    return {
+        'action': 'query',
+        'list': 'search',
+        'srnamespace': namespace,
+        'srlimit': limit,
+        **BASE_PARAMS,
+        'srsearch': search_request,
+        'srwhat': 'text',
+    }
+
+
+def get_deletedrevs_params(namespace: int, limit: int) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to list deleted revisions."""
+    return {
+        'action': 'query',
+        'list': 'deletedrevs',  # TODO: deprecated since MediaWiki 1.25
+        'drnamespace': namespace,
+        'drdir': 'newer',
+        'drlimit': limit,
+        'drprop': 'revid|user|comment|content',
+        # JSON format 1 is kept, so revision text stays under `*` key in
+        # output of `list-deletedrevs`
+        'format': 'json',
+        'utf8': '1',
+    }
+
+
+def iterate_revisions(
+    deletedrev_data: Dict[str, Any]
+) -> Iterator[Dict[str, Any]]:
+    """Iterate over revisions of deleted page, adding page title to them."""
+    title: str = deletedrev_data['title']
+
+    for revision in deletedrev_data['revisions']:
+        revision['title'] = title
+        yield revision
+
+
+def get_token_params(token_type: str) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to get token of `token_type`."""
+    return {
+        'action': 'query',
+        'meta': 'tokens',
+        'type': token_type,
+        **BASE_PARAMS,
+    }
+
+
+def get_login_params(
+    username: str, password: str, token: str
+) -> Dict[str, Any]:
+    """Return MediaWiki 1.31 API parameters to log in with login `token`."""
+    return {
+        'action': 'login',
+        **BASE_PARAMS,
+        'lgname': username,
+        'lgpassword': password,
+        'lgtoken': token,
+    }
+
+
+class TokenCache:
+    """
+    Cache of page tokens.
+
+    At most `max_size` tokens are kept, least recently used ones are evicted.
+    """
+
+    tokens: 'collections.OrderedDict[str, str]'
+    max_size: int
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE):
+        """Create empty token cache."""
+        self.tokens = collections.OrderedDict()
+        self.max_size = max_size
+
+    def __contains__(self, title: object) -> bool:
+        """Check if token for page with `title` is cached."""
+        return title in self.tokens
+
+    def __getitem__(self, title: str) -> str:
+        """Return cached token for page with `title`."""
+        self.tokens.move_to_end(title)
+        return self.tokens[title]
+
+    def discard(self, title: str) -> None:
+        """Remove token for page with `title` from cache, if it is cached."""
+        self.tokens.pop(title, None)
+
+    def __len__(self) -> int:
+        """Return number of cached tokens."""
+        return len(self.tokens)
+
+    def update(self, tokens: Dict[str, str]) -> None:
+        """Add `tokens` (page tokens by page titles) to cache."""
+        for title, token in tokens.items():
+            self.tokens[title] = token
+            self.tokens.move_to_end(title)
+        while len(self.tokens) > self.max_size:
+            self.tokens.popitem(last=False)
+
+
 class MediaWikiAPI(ABC):
     """Base MediaWiki API class."""
 
+    api_url: str
+    index_url: str
+    # Dotted path to continuation parameters in API response, `{list_key}` is
+    # replaced with name of requested list
+    continue_path: str
+    session: requests.Session
+    executor: ThreadPoolExecutor
+    fast_path: bool
+    get_template: requests.PreparedRequest
+    get_settings: Dict[str, Any]
+
+    def __init__(self, url: str, fast_path: bool = True):
+        """
+        Create MediaWiki API class with given API URL.
+
+        If `fast_path` is false, environment settings (like proxies) are
+        looked up for every paginated request.
+        """
+        self.api_url = f'{url}/api.php'
+        self.index_url = f'{url}/index.php'
+        self.session = create_session()
+        self.executor = ThreadPoolExecutor(max_workers=WORKERS_NUM)
+        self.fast_path = fast_path
+        self.get_template, self.get_settings = prepare_get(
+            self.session, self.api_url
+        )
+
+    def close(self) -> None:
+        """Close HTTP session and stop background threads."""
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+    def send_get(self, url: str, stream: bool = False) -> requests.Response:
+        """
+        Perform GET request with already encoded `url`.
+
+        If `fast_path` is true, request is copied from prepared template and
+        sent with settings resolved once, instead of being prepared and merged
+        with environment settings again. Only cookies are updated.
+        """
+        if not self.fast_path:
+            return self.session.get(url, stream=stream)
+
+        request = self.get_template.copy()
+        request.url = url
+        request.headers.pop('Cookie', None)
+        request.prepare_cookies(self.session.cookies)
+        return self.session.send(request, stream=stream, **self.get_settings)
+
+    def prefetch(
+        self, url: str, stream: bool = False
+    ) -> 'Future[requests.Response]':
+        """Start GET request to API `url` in background thread."""
+        return self.executor.submit(self.send_get, url, stream=stream)
+
+    def paginate(
+        self, params: Dict[str, Any], list_key: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all items of API query list `list_key`.
+
+        Request pages with `params` one by one, following continuation. Next
+        page is requested in background while current page is consumed.
+        """
+        continue_path = self.continue_path.format(list_key=list_key)
+        # Query string is encoded once, only continuation is added to it
+        base_url = f'{self.api_url}?{urlencode(params)}'
+        future = self.prefetch(base_url)
+
+        while True:
+            r = future.result()
+            if r.status_code != 200:
+                raise MediaWikiAPIError(f'Status code is {r.status_code}')
+
+            data = parse_json(r.content)
+            if 'error' in data:
+                raise_api_error(data['error'])
+            last_continue = get_continue(data, continue_path)
+            if last_continue is not None:
+                future = self.prefetch(
+                    f'{base_url}&{urlencode(last_continue)}'
+                )
+
+            yield from data['query'][list_key]
+
+            if last_continue is None:
+                break
+
+    def paginate_stream(
+        self, params: Dict[str, Any], list_key: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all items of API query list `list_key`.
+
+        Same as `paginate`, but responses are parsed incrementally instead of
+        being loaded at once, for lists which may contain page contents.
+        """
+        continue_path = self.continue_path.format(list_key=list_key)
+        base_url = f'{self.api_url}?{urlencode(params)}'
+        future: Optional['Future[requests.Response]'] = self.prefetch(
+            base_url, stream=True
+        )
+
+        try:
+            while future is not None:
+                with future.result() as r:
+                    future = None
+                    if r.status_code != 200:
+                        raise MediaWikiAPIError(
+                            f'Status code is {r.status_code}'
+                        )
+
+                    r.raw.decode_content = True
+                    for prefix, value in iterate_json_values(r.raw, (
+                        'error', continue_path, f'query.{list_key}.item',
+                    )):
+                        if prefix == 'error':
+                            raise_api_error(value)
+                        if prefix == continue_path:
+                            future = self.prefetch(
+                                f'{base_url}&{urlencode(value)}', stream=True
+                            )
+                            continue
+
+                        yield value
+        finally:
+            # Next page is already requested if iteration is stopped early
+            if future is not None:
+                future.add_done_callback(close_response)
+
+    def __enter__(self) -> 'MediaWikiAPI':
+        """Return self for use in `with` statement."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close API on leaving `with` statement."""
+        self.close()
+
     @abstractmethod
     def get_namespace_list(self) -> Iterable[int]:
         """Get iterable of all namespaces in wiki."""
@@ -74,12 +542,31 @@ class MediaWikiAPI(ABC):
         """Iterate over all page names in wiki in `namespace`."""
         raise NotImplementedError()
 
-    @abstractmethod
     def get_page(
         self, title: str,
     ) -> str:
         """Get text of page with `title`."""
-        raise NotImplementedError()
+        r = self.session.get(self.index_url, params=get_page_params(title))
+        if r.status_code != 200:
+            raise MediaWikiAPIError(
+                f'Status code is {r.status_code}'
+            )
+
+        return decode_page(r.content)
+
+    def get_pages_bulk(self, titles: Iterable[str]) -> Iterator[str]:
+        """
+        Iterate over texts of pages with `titles`, in the same order.
+
+        Up to `PAGES_PREFETCH_NUM` pages are requested ahead in background.
+        """
+        futures: Deque['Future[str]'] = collections.deque()
+        for title in titles:
+            futures.append(self.executor.submit(self.get_page, title))
+            if len(futures) > PAGES_PREFETCH_NUM:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
 
     @abstractmethod
     def search_pages(
@@ -117,6 +604,13 @@ class MediaWikiAPI(ABC):
         """Edit page, setting new text."""
         raise NotImplementedError()
 
+    def prefetch_tokens(self, token_type: str, titles: List[str]) -> None:
+        """
+        Get tokens for editing or deleting pages with `titles` in advance.
+
+        By default nothing is done, as one token is used for all pages.
+        """
+
     @abstractmethod
     def get_backlinks(
         self, title: str, namespace: Optional[int], limit: int
@@ -133,19 +627,15 @@ class MediaWikiAPI(ABC):
 class MediaWikiAPI1_19(MediaWikiAPI):
     """MediaWiki API 1.19 class with authentication data."""
 
-    api_url: str
-    index_url: str
-    session: requests.Session
-    edit_tokens: Dict[str, str]
-    delete_tokens: Dict[str, str]
+    continue_path = 'query-continue.{list_key}'
+    edit_tokens: TokenCache
+    delete_tokens: TokenCache
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, fast_path: bool = True):
         """Create MediaWiki API 1.19 class with given API URL."""
-        self.api_url = '{}/api.php'.format(url)
-        self.index_url = '{}/index.php'.format(url)
-        self.session = requests.Session()
-        self.edit_tokens = dict()
-        self.delete_tokens = dict()
+        super().__init__(url, fast_path)
+        self.edit_tokens = TokenCache()
+        self.delete_tokens = TokenCache()
 
     def get_namespace_list(self) -> List[int]:
         """Iterate over namespaces in wiki."""
@@ -158,22 +648,13 @@ class MediaWikiAPI1_19(MediaWikiAPI):
 
         r = self.session.get(self.api_url, params=params)
         if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
+            raise MediaWikiAPIError(f'Status code is {r.status_code}')
 
-        data = r.json()
+        data = parse_json(r.content)
         if 'error' in data:
             raise MediaWikiAPIError(data['error'])
-        namespaces = data['query']['namespaces']
-
-        return list(
-            filter(
-                lambda namespace_id: namespace_id >= 0,
-                map(
-                    int,
-                    namespaces.keys()
-                )
-            )
-        )
+
+        return get_namespace_ids(data)
 
     def get_user_contributions_list(
         self, namespace: int, limit: int, user: str,
@@ -198,36 +679,8 @@ class MediaWikiAPI1_19(MediaWikiAPI):
             params['ucstart'] = int(start_date.timestamp())
         if end_date is not None:
             params['ucend'] = int(end_date.timestamp())
-        last_continue: Dict[str, Any] = {}
 
-        r = self.session.get(self.api_url, params=params)
-        if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
-
-        data = r.json()
-        if 'error' in data:
-            raise MediaWikiAPIError(data['error'])
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
-
-            data = r.json()
-            if 'error' in data:
-                raise MediaWikiAPIError(data['error'])
-            user_contribs = data['query']['usercontribs']
-
-            for user_contrib in user_contribs:
-                yield user_contrib
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['usercontribs']
+        return self.paginate(params, 'usercontribs')
 
     def get_category_members(
         self, category_name: str, limit: int,
@@ -249,31 +702,9 @@ class MediaWikiAPI1_19(MediaWikiAPI):
             'ailimit': limit,
             'format': 'json',
         }
-        last_continue: Dict[str, Any] = {}
 
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
-
-            data = r.json()
-            if 'error' in data:
-                raise MediaWikiAPIError(data['error'])
-            images = data['query']['allimages']
-
-            for image_data in images:
-                yield {
-                    'title': image_data['title'],
-                    'url': image_data['url'],
-                }
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['allimages']
+        for image_data in self.paginate(params, 'allimages'):
+            yield get_image_data(image_data)
 
     def get_page_image_list(
         self, image_ids_limit: int, page_ids: List[int]
@@ -297,45 +728,9 @@ class MediaWikiAPI1_19(MediaWikiAPI):
         }
         if first_page is not None:
             params['apfrom'] = first_page
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
 
-            data = r.json()
-            if 'error' in data:
-                raise MediaWikiAPIError(data['error'])
-            pages = data['query']['allpages']
-
-            for page_data in pages:
-                yield page_data['title']
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['allpages']
-
-    def get_page(
-        self, title: str,
-    ) -> str:
-        """Get text of page with `title`."""
-        params: Dict[str, Any] = {
-            'action': 'raw',
-            'title': title,
-        }
-
-        r = self.session.get(self.index_url, params=params)
-        if r.status_code != 200:
-            raise MediaWikiAPIError(
-                'Status code is {}'.format(r.status_code)
-            )
-
-        return r.text
+        for page_data in self.paginate(params, 'allpages'):
+            yield page_data['title']
 
     def search_pages(
         self, search_request: str, namespace: int, limit: int,
@@ -356,32 +751,13 @@ class MediaWikiAPI1_19(MediaWikiAPI):
             'drprop': 'revid|user|comment|content',
             'format': 'json',
         }
-        last_continue: Dict[str, Any] = {}
 
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
+        for deletedrev_data in self.paginate_stream(params, 'deletedrevs'):
+            title: str = deletedrev_data['title']
 
-            data = r.json()
-            if 'error' in data:
-                raise MediaWikiAPIError(data['error'])
-            deletedrevs = data['query']['deletedrevs']
-
-            for deletedrev_data in deletedrevs:
-                title: str = deletedrev_data['title']
-
-                for revision in deletedrev_data['revisions']:
-                    revision.update({'title': title})
-                    yield revision
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['deletedrevs']
+            for revision in deletedrev_data['revisions']:
+                revision['title'] = title
+                yield revision
 
     def delete_page(
             self, page_name: str, reason: Optional[str] = None
@@ -394,16 +770,16 @@ class MediaWikiAPI1_19(MediaWikiAPI):
         }
         if reason is not None:
             params['reason'] = reason
-        if page_name not in self.delete_tokens:
-            self.delete_tokens.update(self.get_tokens('delete', page_name))
-        params['token'] = self.delete_tokens[page_name],
+        params['token'] = self.get_page_token('delete', page_name)
 
         r = self.session.post(self.api_url, data=params)
         if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
+            raise MediaWikiAPIError(f'Status code is {r.status_code}')
 
-        data = r.json()
+        data = parse_json(r.content)
         if 'error' in data:
+            if data['error']['code'] == 'badtoken':
+                self.delete_tokens.discard(page_name)
             if data['error']['code'] == 'cantdelete':
                 raise CanNotDelete(data['error']['info'])
             raise MediaWikiAPIError(data['error'])
@@ -422,16 +798,16 @@ class MediaWikiAPI1_19(MediaWikiAPI):
         }
         if summary is not None:
             params['summary'] = summary
-        if page_name not in self.edit_tokens:
-            self.edit_tokens.update(self.get_tokens('edit', page_name))
-        params['token'] = self.edit_tokens[page_name],
+        params['token'] = self.get_page_token('edit', page_name)
 
         r = self.session.post(self.api_url, data=params)
         if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
+            raise MediaWikiAPIError(f'Status code is {r.status_code}')
 
-        data = r.json()
+        data = parse_json(r.content)
         if 'error' in data:
+            if data['error']['code'] == 'badtoken':
+                self.edit_tokens.discard(page_name)
             if data['error']['code'] == 'protectedpage':
                 raise PageProtected(data['error'])
             raise MediaWikiAPIError(data['error'])
@@ -457,20 +833,65 @@ class MediaWikiAPI1_19(MediaWikiAPI):
 
         r = self.session.post(self.api_url, data=params)
         if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
+            raise MediaWikiAPIError(f'Status code is {r.status_code}')
 
-        data = r.json()
+        data = parse_json(r.content)
         if 'error' in data:
             raise MediaWikiAPIError(data['error'])
         if 'warning' in data:
             raise MediaWikiAPIError(data['warning'])
 
-        return dict(map(
-            lambda page_data: (
-                    page_data['title'], page_data['{}token'.format(token_type)]
-                    ),
-            data['query']['pages'].values()
-        ))
+        token_key = f'{token_type}token'
+        # Invalid titles have no token, they are skipped
+        tokens = {
+            page_data['title']: page_data[token_key]
+            for page_data in data['query']['pages'].values()
+            if token_key in page_data
+        }
+        # Tokens are also returned for titles as given, so titles normalized
+        # by MediaWiki are found in cache
+        for normalized in data['query'].get('normalized', []):
+            if normalized['to'] in tokens:
+                tokens[normalized['from']] = tokens[normalized['to']]
+
+        return tokens
+
+    def get_token_cache(self, token_type: str) -> TokenCache:
+        """Return cache of page tokens of `token_type`."""
+        return {
+            'edit': self.edit_tokens,
+            'delete': self.delete_tokens,
+        }[token_type]
+
+    def get_page_token(self, token_type: str, title: str) -> str:
+        """
+        Return page token of `token_type` for page with `title`.
+
+        Token is requested if it is not cached.
+        """
+        tokens = self.get_token_cache(token_type)
+        if title not in tokens:
+            tokens.update(self.get_tokens(token_type, title))
+        if title not in tokens:
+            raise MediaWikiAPIError(f'No {token_type} token for page {title}')
+        return tokens[title]
+
+    def prefetch_tokens(self, token_type: str, titles: List[str]) -> None:
+        """
+        Get page tokens for all `titles` at once.
+
+        `token_type` can be `edit` or `delete`. Tokens are requested for
+        `TITLES_LIMIT` titles per API request and cached, so following edits
+        or deletions of these pages do not request tokens one by one. Only
+        last `TOKEN_CACHE_SIZE` tokens are kept.
+        """
+        tokens = self.get_token_cache(token_type)
+        missing_titles = [title for title in titles if title not in tokens]
+
+        for i in range(0, len(missing_titles), TITLES_LIMIT):
+            tokens.update(self.get_tokens(
+                token_type, '|'.join(missing_titles[i:i + TITLES_LIMIT])
+            ))
 
     def get_backlinks(
         self, title: str, namespace: Optional[int], limit: int
@@ -486,28 +907,7 @@ class MediaWikiAPI1_19(MediaWikiAPI):
         if namespace is not None:
             params['blnamespace'] = namespace
 
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
-
-            data = r.json()
-            if 'error' in data:
-                raise MediaWikiAPIError(data['error'])
-            backlinks = data['query']['backlinks']
-
-            for backlink in backlinks:
-                yield backlink
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['backlinks']
+        return self.paginate(params, 'backlinks')
 
     def api_login(self, username: str, password: str) -> None:
         """Log in to MediaWiki API."""
@@ -520,9 +920,9 @@ class MediaWikiAPI1_19(MediaWikiAPI):
 
         r1 = self.session.post(self.api_url, params1)
         if r1.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r1.status_code))
+            raise MediaWikiAPIError(f'Status code is {r1.status_code}')
 
-        data1 = r1.json()
+        data1 = parse_json(r1.content)
         if 'error' in data1:
             raise MediaWikiAPIError(data1['error'])
         if 'warning' in data1:
@@ -532,9 +932,9 @@ class MediaWikiAPI1_19(MediaWikiAPI):
             return
 
         if data1['login']['result'] != 'NeedToken':
-            raise MediaWikiAPIError('Login result is {}'.format(
-                data1['login']['result']
-            ))
+            raise MediaWikiAPIError(
+                f"Login result is {data1['login']['result']}"
+            )
 
         params2: Dict[str, Any] = {
             'action': 'login',
@@ -546,53 +946,46 @@ class MediaWikiAPI1_19(MediaWikiAPI):
 
         r2 = self.session.post(self.api_url, data=params2)
         if r2.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r2.status_code))
+            raise MediaWikiAPIError(f'Status code is {r2.status_code}')
 
-        data2 = r2.json()
+        data2 = parse_json(r2.content)
         if 'error' in data2:
             raise MediaWikiAPIError(data2['error'])
         if 'warning' in data2:
             raise MediaWikiAPIError(data2['warning'])
 
         if data2['login']['result'] != 'Success':
-            raise MediaWikiAPIError('Login result is {}'.format(
-                data2['login']['result']
-            ))
+            raise MediaWikiAPIError(
+                f"Login result is {data2['login']['result']}"
+            )
 
 
 class MediaWikiAPI1_31(MediaWikiAPI):
     """MediaWiki API 1.31 class with authentication data."""
 
-    api_url: str
-    index_url: str
-    session: requests.Session
+    continue_path = 'continue'
     csrf_token: Optional[str]
+    csrf_token_time: float
+    namespace_list: Optional[List[int]]
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, fast_path: bool = True):
         """Create MediaWiki API 1.31 class with given API URL."""
-        self.api_url = '{}/api.php'.format(url)
-        self.index_url = '{}/index.php'.format(url)
-        self.session = requests.Session()
+        super().__init__(url, fast_path)
         self.csrf_token = None
+        self.csrf_token_time = 0.0
+        self.namespace_list = None
 
     def get_namespace_list(self) -> List[int]:
-        """Iterate over namespaces in wiki."""
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'meta': 'siteinfo',
-            'siprop': 'namespaces',
-            'format': 'json',
-        }
+        """
+        Iterate over namespaces in wiki.
 
-        data = self.call_api(params)
-        namespaces = data['query']['namespaces']
+        Namespaces are requested once, then cached list is used.
+        """
+        if self.namespace_list is None:
+            data = self.call_api(get_namespace_list_params())
+            self.namespace_list = get_namespace_ids(data)
 
-        return list(
-            filter(
-                lambda namespace_id: namespace_id >= 0,
-                map(int, namespaces.keys())
-            )
-        )
+        return list(self.namespace_list)
 
     def get_user_contributions_list(
         self, namespace: int, limit: int, user: str,
@@ -611,27 +1004,14 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             'ucnamespace': namespace,
             'ucuser': user.replace(' ', '_'),
             'ucdir': 'newer',
-            'format': 'json',
+            **BASE_PARAMS,
         }
         if start_date is not None:
             params['ucstart'] = int(start_date.timestamp())
         if end_date is not None:
             params['ucend'] = int(end_date.timestamp())
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(current_params)
-            user_contribs = data['query']['usercontribs']
-
-            for user_contrib in user_contribs:
-                yield user_contrib
 
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['usercontribs']
+        return self.paginate(params, 'usercontribs')
 
     def get_image_list(self, limit: int) -> Iterator[Dict[str, str]]:
         """
@@ -639,31 +1019,10 @@ class MediaWikiAPI1_31(MediaWikiAPI):
 
         Each image data is dictionary with two fields: `title` and `url`.
         """
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'list': 'allimages',
-            'aidir': 'ascending',
-            'ailimit': limit,
-            'format': 'json',
-        }
-        last_continue: Dict[str, Any] = {}
+        params = get_image_list_params(limit)
 
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(current_params)
-            images = data['query']['allimages']
-
-            for image_data in images:
-                yield {
-                    'title': image_data['title'],
-                    'url': image_data['url'],
-                }
-
-            if 'continue' not in data:
-                break
-            last_continue = data['continue']
+        for image_data in self.paginate(params, 'allimages'):
+            yield get_image_data(image_data)
 
     def get_page_image_list(
         self, image_ids_limit: int, page_ids: List[int]
@@ -674,26 +1033,24 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             'prop': 'imageinfo',
             'iiprop': 'url',
             'iilimit': 1,
-            'format': 'json',
+            **BASE_PARAMS,
         }
 
         i: int = 0
         while i < len(page_ids):
-            current_params = params.copy()
             page_ids_group: List[int]
             if (i + image_ids_limit) >= len(page_ids):
                 page_ids_group = page_ids[i:]
             else:
                 page_ids_group = page_ids[i:i + image_ids_limit]
-            current_params['pageids'] = '|'.join(
+            params['pageids'] = '|'.join(
                 list(map(str, page_ids_group))
             )
 
-            data = self.call_api(current_params)
+            data = self.call_api(params)
             pages_data = data['query']['pages']
 
-            for page_id in pages_data:
-                page_data = pages_data[page_id]
+            for page_data in pages_data:
                 yield {
                     'title': page_data['title'],
                     'url': page_data['imageinfo'][0]['url'],
@@ -716,138 +1073,44 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             'cmtitle': category_name,
             'cmdir': 'ascending',
             'cmlimit': limit,
-            'format': 'json',
+            **BASE_PARAMS,
         }
         if member_type in ['page', 'subcat', 'file']:
             params['cmtype'] = member_type
         if namespace is not None:
             params['cmnamespace'] = namespace
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(current_params)
-            pages = data['query']['categorymembers']
 
-            for page_data in pages:
-                yield page_data
-
-            if 'continue' not in data:
-                break
-            last_continue = data['continue']
+        return self.paginate(params, 'categorymembers')
 
     def get_page_list(
         self, namespace: int, limit: int, first_page: Optional[str] = None,
         redirect_filter_mode: str = 'all'
     ) -> Iterator[str]:
         """Iterate over all page names in wiki in `namespace`."""
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'list': 'allpages',
-            'apnamespace': namespace,
-            'apdir': 'ascending',
-            'apfilterredir': redirect_filter_mode,
-            'aplimit': limit,
-            'format': 'json',
-        }
-        if first_page is not None:
-            params['apfrom'] = first_page
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(current_params)
-            pages = data['query']['allpages']
-
-            for page_data in pages:
-                yield page_data['title']
-
-            if 'continue' not in data:
-                break
-            last_continue = data['continue']
-
-    def get_page(
-        self, title: str
-    ) -> str:
-        """Get text of page with `title`."""
-        params: Dict[str, Any] = {
-            'action': 'raw',
-            'title': title,
-        }
-
-        r = self.session.get(self.index_url, params=params)
-        if r.status_code != 200:
-            raise MediaWikiAPIError(
-                'Status code is {}'.format(r.status_code)
-            )
+        params = get_page_list_params(
+            namespace, limit, first_page, redirect_filter_mode
+        )
 
-        return r.text
+        for page_data in self.paginate(params, 'allpages'):
+            yield page_data['title']
 
     def search_pages(
         self, search_request: str, namespace: int, limit: int,
     ) -> Iterator[str]:
-        """Iterate over all page names in wiki in `namespace`."""
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'list': 'search',
-            'srnamespace': namespace,
-            'srlimit': limit,
-            'format': 'json',
-            'srsearch': search_request,
-            'srwhat': 'text',
-        }
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(params)
-            pages = data['query']['search']
-
-            for page_data in pages:
-                yield page_data['title']
+        """Search pages in wiki in `namespace` with `search_request`."""
+        params = get_search_params(search_request, namespace, limit)
 
-            if 'continue' not in data:
-                break
-            last_continue = data['continue']
+        for page_data in self.paginate(params, 'search'):
+            yield page_data['title']
 
     def get_deletedrevs_list(
         self, namespace: int, limit: int
     ) -> Iterator[Dict[str, Any]]:
         """Iterate over deleted revisions in wiki in `namespace`."""
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'list': 'deletedrevs',  # TODO: deprecated since MediaWiki 1.25
-            'drnamespace': namespace,
-            'drdir': 'newer',
-            'drlimit': limit,
-            'drprop': 'revid|user|comment|content',
-            'format': 'json',
-        }
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-
-            data = self.call_api(current_params)
-            deletedrevs = data['query']['deletedrevs']
+        params = get_deletedrevs_params(namespace, limit)
 
-            for deletedrev_data in deletedrevs:
-                title: str = deletedrev_data['title']
-
-                for revision in deletedrev_data['revisions']:
-                    revision.update({'title': title})
-                    yield revision
-
-            if 'continue' not in data:
-                break
-            last_continue = data['continue']
+        for deletedrev_data in self.paginate_stream(params, 'deletedrevs'):
+            yield from iterate_revisions(deletedrev_data)
 
     def delete_page(
             self, page_name: str, reason: Optional[str] = None
@@ -856,7 +1119,7 @@ class MediaWikiAPI1_31(MediaWikiAPI):
         params: Dict[str, Any] = {
             'action': 'delete',
             'title': page_name,
-            'format': 'json',
+            **BASE_PARAMS,
         }
         if reason is not None:
             params['reason'] = reason
@@ -873,7 +1136,7 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             'action': 'edit',
             'title': page_name,
             'text': text,
-            'format': 'json',
+            **BASE_PARAMS,
         }
         if summary is not None:
             params['summary'] = summary
@@ -887,14 +1150,11 @@ class MediaWikiAPI1_31(MediaWikiAPI):
         text: Optional[str] = None, ignore_warnings: bool = True
     ) -> None:
         """Upload file."""
-        if self.csrf_token is None:
-            self.csrf_token = self.get_token('csrf')
-
         params: Dict[str, Any] = {
             'action': 'upload',
             'filename': file_name,
-            'token': self.csrf_token,
-            'format': 'json',
+            'token': self.get_csrf_token(),
+            **BASE_PARAMS,
             'async': '1',  # TODO
             'file': (file_name, file, mime_type),
         }
@@ -912,9 +1172,9 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             }
         )
         if r.status_code != 200:
-            raise MediaWikiAPIError('Status code is {}'.format(r.status_code))
+            raise MediaWikiAPIError(f'Status code is {r.status_code}')
 
-        data = r.json()
+        data = parse_json(r.content)
         if 'error' in data:
             raise MediaWikiAPIError(data['error'])
 
@@ -922,16 +1182,21 @@ class MediaWikiAPI1_31(MediaWikiAPI):
 
     def get_token(self, token_type: str) -> str:
         """Return CSRF token for API."""
-        params: Dict[str, Any] = {
-            'action': 'query',
-            'meta': 'tokens',
-            'type': token_type,
-            'format': 'json',
-        }
+        data = self.call_api(get_token_params(token_type))
+
+        return data['query']['tokens'][f'{token_type}token']
 
-        data = self.call_api(params)
+    def get_csrf_token(self) -> str:
+        """
+        Return cached CSRF token for API.
 
-        return data['query']['tokens']['{}token'.format(token_type)]
+        Token is requested again if it is older than `CSRF_TOKEN_TTL` seconds.
+        """
+        if (self.csrf_token is None
+                or time.monotonic() - self.csrf_token_time > CSRF_TOKEN_TTL):
+            self.csrf_token = self.get_token('csrf')
+            self.csrf_token_time = time.monotonic()
+        return self.csrf_token
 
     def get_backlinks(
         self, title: str, namespace: Optional[int], limit: int
@@ -942,47 +1207,17 @@ class MediaWikiAPI1_31(MediaWikiAPI):
             'list': 'backlinks',
             'bltitle': title,
             'bllimit': limit,
-            'format': 'json',
+            **BASE_PARAMS,
         }
         if namespace is not None:
             params['blnamespace'] = namespace
 
-        last_continue: Dict[str, Any] = {}
-
-        while True:
-            current_params = params.copy()
-            current_params.update(last_continue)
-            r = self.session.get(self.api_url, params=current_params)
-            if r.status_code != 200:
-                raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
-                )
-
-            data = r.json()
-            if 'error' in data:
-                if data['error']['code'] == 'protectedpage':
-                    raise PageProtected(data['error'])
-                raise MediaWikiAPIError(data['error'])
-            backlinks = data['query']['backlinks']
-
-            for backlink in backlinks:
-                yield backlink
-
-            if 'query-continue' not in data:
-                break
-            last_continue = data['query-continue']['backlinks']
+        return self.paginate(params, 'backlinks')
 
     def api_login(self, username: str, password: str) -> None:
         """Log in to MediaWiki API."""
         token = self.get_token('login')
-
-        params: Dict[str, Any] = {
-            'action': 'login',
-            'format': 'json',
-            'lgname': username,
-            'lgpassword': password,
-            'lgtoken': token,
-        }
+        params = get_login_params(username, password, token)
 
         self.call_api(params, is_post=True, need_token=False)
 
@@ -993,13 +1228,12 @@ class MediaWikiAPI1_31(MediaWikiAPI):
         """
         Perform request to MediaWiki API.
 
-        Get token if necessary, raise exception on error.
+        Get token if necessary, raise exception on error. If token is
+        rejected, get new token and retry once.
         """
         while True:
             if need_token:
-                if self.csrf_token is None:
-                    self.csrf_token = self.get_token('csrf')
-                params['token'] = self.csrf_token
+                params['token'] = self.get_csrf_token()
 
             if is_post:
                 r = self.session.post(self.api_url, data=params)
@@ -1008,17 +1242,220 @@ class MediaWikiAPI1_31(MediaWikiAPI):
 
             if r.status_code != 200:
                 raise MediaWikiAPIError(
-                    'Status code is {}'.format(r.status_code)
+                    f'Status code is {r.status_code}'
                 )
 
-            data: Dict[str, Any] = r.json()
+            data: Dict[str, Any] = parse_json(r.content)
             if 'error' in data:
                 if need_token and token_retry:
                     if data['error']['code'] == 'badtoken':
-                        self.csrf_token = self.get_token('csrf')
+                        self.csrf_token = None
+                        token_retry = False
                         continue
-                if data['error']['code'] == 'cantdelete':
-                    raise CanNotDelete(data['error']['info'])
-                raise MediaWikiAPIError(data['error']['info'])
+                raise_api_error(data['error'])
 
             return data
+
+
+class AsyncMediaWikiAPI1_31:
+    """
+    Asynchronous MediaWiki API 1.31 class with authentication data.
+
+    Requires `httpx` with HTTP/2 support or `aiohttp`. With `httpx`,
+    concurrent requests share one HTTP/2 connection. Object should be created
+    inside a coroutine, and closed with `close` when it is not needed anymore.
+    """
+
+    api_url: str
+    index_url: str
+    http2: bool
+    session: Any
+
+    def __init__(self, url: str, http2: bool = True):
+        """
+        Create asynchronous MediaWiki API 1.31 class with given API URL.
+
+        If `http2` is true and `httpx` with HTTP/2 support is installed, it is
+        used, otherwise `aiohttp` is used.
+        """
+        self.api_url = f'{url}/api.php'
+        self.index_url = f'{url}/index.php'
+        self.http2 = http2 and httpx is not None
+        if self.http2:
+            self.session = httpx.AsyncClient(
+                http2=True, headers={'User-Agent': USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=8, max_keepalive_connections=8
+                )
+            )
+        elif aiohttp is not None:
+            self.session = aiohttp.ClientSession(
+                raise_for_status=False, headers={'User-Agent': USER_AGENT}
+            )
+        else:
+            raise MediaWikiAPIError(
+                'httpx or aiohttp is required for asynchronous API'
+            )
+
+    async def close(self) -> None:
+        """Close underlying HTTP session."""
+        if self.http2:
+            await self.session.aclose()
+        else:
+            await self.session.close()
+
+    async def request(
+        self, method: str, url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Perform HTTP request, return response body."""
+        if self.http2:
+            r = await self.session.request(
+                method, url, params=params, data=data
+            )
+            status = r.status_code
+            content = r.content
+        else:
+            async with self.session.request(
+                method, url, params=params, data=data
+            ) as r:
+                status = r.status
+                content = await r.read()
+
+        if status != 200:
+            raise MediaWikiAPIError(f'Status code is {status}')
+
+        return content
+
+    async def __aenter__(self) -> 'AsyncMediaWikiAPI1_31':
+        """Return self for use in `async with` statement."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close HTTP session on leaving `async with` statement."""
+        await self.close()
+
+    async def get_namespace_list(self) -> List[int]:
+        """Get list of namespaces in wiki."""
+        data = await self.call_api(get_namespace_list_params())
+
+        return get_namespace_ids(data)
+
+    async def get_image_list(
+        self, limit: int
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        Iterate over all images in wiki.
+
+        Each image data is dictionary with two fields: `title` and `url`.
+        """
+        params = get_image_list_params(limit)
+
+        async for image_data in self.paginate(params, 'allimages'):
+            yield get_image_data(image_data)
+
+    async def get_page_list(
+        self, namespace: int, limit: int, first_page: Optional[str] = None,
+        redirect_filter_mode: str = 'all'
+    ) -> AsyncIterator[str]:
+        """Iterate over all page names in wiki in `namespace`."""
+        params = get_page_list_params(
+            namespace, limit, first_page, redirect_filter_mode
+        )
+
+        async for page_data in self.paginate(params, 'allpages'):
+            yield page_data['title']
+
+    async def get_page(
+        self, title: str
+    ) -> str:
+        """Get text of page with `title`."""
+        content = await self.request(
+            'GET', self.index_url, params=get_page_params(title)
+        )
+
+        return decode_page(content)
+
+    async def fetch_pages_bulk(
+        self, titles: Iterable[str], concurrency: int = 8
+    ) -> List[str]:
+        """
+        Get texts of pages with `titles`, in the same order.
+
+        At most `concurrency` requests are performed at the same time.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(title: str) -> str:
+            async with semaphore:
+                return await self.get_page(title)
+
+        return list(await asyncio.gather(
+            *(fetch_page(title) for title in titles)
+        ))
+
+    async def search_pages(
+        self, search_request: str, namespace: int, limit: int,
+    ) -> AsyncIterator[str]:
+        """Search pages in wiki in `namespace` with `search_request`."""
+        params = get_search_params(search_request, namespace, limit)
+
+        async for page_data in self.paginate(params, 'search'):
+            yield page_data['title']
+
+    async def get_deletedrevs_list(
+        self, namespace: int, limit: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over deleted revisions in wiki in `namespace`."""
+        params = get_deletedrevs_params(namespace, limit)
+
+        async for deletedrev_data in self.paginate(params, 'deletedrevs'):
+            for revision in iterate_revisions(deletedrev_data):
+                yield revision
+
+    async def paginate(
+        self, params: Dict[str, Any], list_key: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all items of API query list `list_key`.
+
+        Request pages with `params` one by one, following continuation.
+        """
+        while True:
+            data = await self.call_api(params)
+
+            for item in data['query'][list_key]:
+                yield item
+
+            if 'continue' not in data:
+                break
+            params.update(data['continue'])
+
+    async def get_token(self, token_type: str) -> str:
+        """Return CSRF token for API."""
+        data = await self.call_api(get_token_params(token_type))
+
+        return data['query']['tokens'][f'{token_type}token']
+
+    async def api_login(self, username: str, password: str) -> None:
+        """Log in to MediaWiki API."""
+        token = await self.get_token('login')
+        params = get_login_params(username, password, token)
+
+        await self.call_api(params, is_post=True)
+
+    async def call_api(
+        self, params: Dict[str, Any], is_post: bool = False
+    ) -> Dict[str, Any]:
+        """Perform request to MediaWiki API, raise exception on error."""
+        if is_post:
+            content = await self.request('POST', self.api_url, data=params)
+        else:
+            content = await self.request('GET', self.api_url, params=params)
+
+        data: Dict[str, Any] = parse_json(content)
+        if 'error' in data:
+            raise_api_error(data['error'])
+
+        return data
@@ -2,6 +2,7 @@
 """Script for interacting with MediaWiki."""
 import copy
 import datetime
+import itertools
 import json
 import mimetypes
 import os
@@ -75,6 +76,18 @@ def cli(
     ctx.obj['MEDIAWIKI_VERSION'] = mediawiki_version
 
 
+def iterate_batches(
+    iterable: Iterable[str], size: int
+) -> Iterator[List[str]]:
+    """Iterate over lists of up to `size` consecutive items of `iterable`."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
 def get_mediawiki_api(
     mediawiki_version: str, api_url: str
 ) -> mediawiki.MediaWikiAPI:
@@ -355,23 +368,29 @@ def delete_pages(
     failed_num: int = 0
 
     for namespace_item in namespace:
-        for page_name in filter(
+        page_names = filter(
             lambda page_name:
-            compiled_filter_expression.match(page_name) is not None,
+            compiled_filter_expression.match(page_name) is not None and (
+                compiled_exclude_expression is None
+                or compiled_exclude_expression.match(page_name) is None
+            ),
             api.get_page_list(
                 namespace_item, api_limit, first_page=first_page
             )
+        )
+        # Tokens are requested for many pages at once
+        for page_names_batch in iterate_batches(
+            page_names, mediawiki.TITLES_LIMIT
         ):
-            if compiled_exclude_expression is not None:
-                if compiled_exclude_expression.match(page_name):
-                    continue
-            try:
-                api.delete_page(page_name, reason)
-                click.echo('Deleted {}'.format(page_name))
-                deleted_num += 1
-            except mediawiki.CanNotDelete:
-                click.echo('Can not delete {}'.format(page_name))
-                failed_num += 1
+            api.prefetch_tokens('delete', page_names_batch)
+            for page_name in page_names_batch:
+                try:
+                    api.delete_page(page_name, reason)
+                    click.echo('Deleted {}'.format(page_name))
+                    deleted_num += 1
+                except mediawiki.CanNotDelete:
+                    click.echo('Can not delete {}'.format(page_name))
+                    failed_num += 1
 
     click.echo('{} pages deleted.'.format(deleted_num))
     if failed_num > 0:
@@ -436,20 +455,26 @@ def edit_pages(
     edited_num: int = 0
 
     for namespace_item in namespace:
-        for page_name in filter(
+        page_names = filter(
             lambda page_name:
-            compiled_filter_expression.match(page_name) is not None,
+            compiled_filter_expression.match(page_name) is not None and (
+                exclude_filter_expression is None
+                or exclude_filter_expression.match(page_name) is None
+            ),
             api.get_page_list(
                 namespace_item, api_limit, redirect_filter_mode='nonredirects',
                 first_page=first_page
             )
+        )
+        # Tokens are requested for many pages at once
+        for page_names_batch in iterate_batches(
+            page_names, mediawiki.TITLES_LIMIT
         ):
-            if exclude_filter_expression is not None:
-                if exclude_filter_expression.match(page_name):
-                    continue
-            api.edit_page(page_name, new_text, reason)
-            click.echo('Edited {}'.format(page_name))
-            edited_num += 1
+            api.prefetch_tokens('edit', page_names_batch)
+            for page_name in page_names_batch:
+                api.edit_page(page_name, new_text, reason)
+                click.echo('Edited {}'.format(page_name))
+                edited_num += 1
 
     click.echo('{} pages edited.'.format(edited_num))
 
@@ -541,11 +566,13 @@ def replace_links(
     protected_num: int = 0
 
     backlinks = list(api.get_backlinks(old, None, api_limit))
+    texts = api.get_pages_bulk(backlink['title'] for backlink in backlinks)
 
-    with click.progressbar(backlinks, length=len(backlinks)) as bar:
-        for backlink in bar:
+    with click.progressbar(
+        zip(backlinks, texts), length=len(backlinks)
+    ) as bar:
+        for backlink, old_text in bar:
             page_name = backlink['title']
-            old_text = api.get_page(page_name)
             new_text1 = re.sub(
                 r'\[\[' + old + r'\|([^\]]+)\]\]',
                 lambda m: '[[' + new + '|' + m.group(1) + ']]',
@@ -739,7 +766,9 @@ def votecount(
                 namespace, api_limit, user, start, end
             ):
                 edit_count += 1
-                if (('new' in contrib)
+                # `new` is empty string in old API versions and boolean in
+                # new ones
+                if ((contrib.get('new', False) is not False)
                         and (regex_redirect.match(contrib['comment'])
                              is None)):
                     pages_count += 1